@@ -15,9 +15,129 @@ Key Concepts:
     and ground existence.
 """
 
+import sys
 import time
+import argparse
 import random
-from typing import Optional, Protocol
+import itertools
+from typing import Iterator, Optional, Protocol, cast
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            func.py_func = func  # Mirror the Numba dispatcher attribute
+            return func
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return wrap(args[0])
+        return wrap
+
+    prange = range
+
+# Character tables for the visual lines, indexed by a 0/1 random mask
+_OBS_CHARS = np.array([ord(' '), ord('.')], dtype=np.uint8)
+_EXIST_CHARS = np.array([ord('~'), ord('*')], dtype=np.uint8)
+
+# Width of one tick's row in the precomputed random pools.
+# rands[0]: meta-loop roll, rands[1]: anchor roll,
+# rands[2]: anchor choice, rands[3]: Existing duration roll
+_RAND_WIDTH = 4
+# Rows of random draws per batch chunk (about 16 MB); bounds --batch memory
+_BATCH_CHUNK_ROWS = 1 << 20
+_VIS_WIDTH = 70
+
+# State tags, cached on Consciousness for cheap dispatch
+OBSERVING_TAG = 0
+EXISTING_TAG = 1
+
+# Rules shared by the object path and the batch kernel
+_INITIAL_FATIGUE = 20.0
+_ANCHOR_PROB = 0.2     # Chance per in-loop tick that an anchor is used
+_RITUAL_CHOICE = 0.5   # Chance that the anchor is the ritual (else the record)
+_RITUAL_RELIEF = 10.0
+_RECORD_RELIEF = 8.0
+
+# -----------------------------------------------------------------
+# 0. Numeric Core (compiled with Numba when available)
+# -----------------------------------------------------------------
+# The step functions are shared by the object path and _batch_kernel.
+# Single calls from Python go through `.py_func`: the dispatch into
+# compiled code costs more than the arithmetic it would save.
+
+@njit(cache=True)
+def _observe_step(fatigue, in_loop, r):
+    """
+    One tick of the Observing arithmetic.
+    Returns (new_fatigue, new_in_loop, should_transition).
+    """
+    if in_loop:
+        fatigue += 3.0  # Fatigue increases sharply
+    else:
+        fatigue += 0.5  # Observation slowly accumulates fatigue
+        # A chance to fall into the 'meta-cognition loop' (probability increases with fatigue)
+        if r < fatigue / 200.0:
+            in_loop = True
+    return fatigue, in_loop, fatigue > 100
+
+@njit(cache=True)
+def _exist_step(fatigue, duration):
+    """
+    One tick of the Existing arithmetic.
+    Returns (new_fatigue, new_duration, should_transition).
+    """
+    fatigue = max(0.0, fatigue - 5.0)  # Recover fatigue
+    duration -= 1
+    return fatigue, duration, duration <= 0
+
+@njit(cache=True)
+def _duration_from_roll(roll):
+    """Existing duration (3 to 6 ticks) for a roll in [0, 1)"""
+    return 3 + int(roll * 4)
+
+@njit(cache=True)
+def _anchor_relief(fatigue, relief):
+    """Fatigue after a Sensory Anchor that removes `relief`"""
+    return max(0.0, fatigue - relief)
+
+@njit(parallel=True, cache=True)
+def _batch_kernel(fatigue, in_loop, duration, state_tag, rand, history):
+    """
+    Advance many independent consciousnesses, stored as parallel arrays,
+    through the same rules as ObservingState/ExistingState and the anchors
+    in run_simulation. rand has shape (M, T, _RAND_WIDTH) for a chunk of
+    T ticks; the fatigue after every tick is written to history, shape (M, T).
+    The state arrays carry over from one chunk to the next.
+    """
+    n_consciousness, n_ticks = history.shape
+    # Trajectories are independent, so each one runs all its ticks in a single task
+    for m in prange(n_consciousness):
+        for t in range(n_ticks):
+            r = rand[m, t]
+            if state_tag[m] == OBSERVING_TAG:
+                f, loop, should_transition = _observe_step(fatigue[m], in_loop[m], r[0])
+                if should_transition:
+                    state_tag[m] = EXISTING_TAG
+                    loop = False
+                    duration[m] = _duration_from_roll(r[3])
+                elif loop and r[1] < _ANCHOR_PROB:
+                    # Sensory Anchor: ritual or record breaks the loop
+                    loop = False
+                    if r[2] < _RITUAL_CHOICE:
+                        f = _anchor_relief(f, _RITUAL_RELIEF)
+                    else:
+                        f = _anchor_relief(f, _RECORD_RELIEF)
+                fatigue[m] = f
+                in_loop[m] = loop
+            else:
+                f, d, should_transition = _exist_step(fatigue[m], duration[m])
+                fatigue[m] = f
+                duration[m] = d
+                if should_transition:
+                    state_tag[m] = OBSERVING_TAG
+            history[m, t] = fatigue[m]
 
 # -----------------------------------------------------------------
 # 1. State Protocol and Visual Representation
@@ -25,15 +145,17 @@ from typing import Optional, Protocol
 
 class State(Protocol):
     """Protocol for a state of consciousness (abstract base)."""
+    TAG: int  # OBSERVING_TAG or EXISTING_TAG
+
     def enter(self, consciousness: 'Consciousness') -> None:
         """Called upon entering the state"""
         ...
 
-    def execute(self, consciousness: 'Consciousness') -> None:
-        """Logic executed on every tick of the state"""
+    def execute(self, consciousness: 'Consciousness', rands: np.ndarray, vis: np.ndarray) -> None:
+        """Logic executed on every tick of the state, using one row of random draws"""
         ...
 
-    def get_visuals(self) -> str:
+    def get_visuals(self, fatigue: float, vis: np.ndarray) -> str:
         """Return the visual representation of the current state"""
         ...
 
@@ -45,63 +167,71 @@ class ObservingState:
     - 'Existential fatigue' slowly accumulates.
     - Risk of falling into the 'meta-cognition' loop (doubting perception itself).
     """
+    __slots__ = ('_in_meta_loop', '_meta_iter')
+
+    TAG = OBSERVING_TAG
+
+    _META_MSGS = (
+        "  ... Does the 'desk' exist?",
+        "  ... What does it mean 'to see'?",
+        "  ... Can 'existence' be asserted?",
+        "  ... Even 'cannot assert' cannot be asserted.",
+        "  ... [Perceptual loop. Fatigue rising rapidly]",
+    )
+
     def __init__(self):
         self._in_meta_loop = False
-        self._meta_loop_counter = 0
+        self._meta_iter: Optional[Iterator[str]] = None  # Created when a loop starts
 
     def enter(self, consciousness: 'Consciousness') -> None:
-        print("\n--- Entering [Observing State]. The world is an 'object of perception'. ---")
+        consciousness.emit("\n--- Entering [Observing State]. The world is an 'object of perception'. ---")
         self._in_meta_loop = False
-        self._meta_loop_counter = 0
 
-    def execute(self, consciousness: 'Consciousness') -> None:
+    def execute(self, consciousness: 'Consciousness', rands: np.ndarray, vis: np.ndarray) -> None:
+        fatigue, in_loop, should_transition = _observe_step.py_func(
+            consciousness.fatigue, self._in_meta_loop, float(rands[0])
+        )
+        consciousness.fatigue = fatigue
+
         if self._in_meta_loop:
             # Meta-cognition loop (dangerous state)
             self._execute_meta_loop(consciousness)
         else:
             # Normal observation state
-            consciousness.fatigue += 0.5  # Observation slowly accumulates fatigue
-            print(self.get_visuals(consciousness.fatigue))
-
-            # A chance to fall into the 'meta-cognition loop' (probability increases with fatigue)
-            if random.random() < (consciousness.fatigue / 200.0):
-                self._start_meta_loop()
+            consciousness.emit(self.get_visuals(consciousness.fatigue, vis))
+            if in_loop:
+                self._start_meta_loop(consciousness)
 
         # If fatigue exceeds the threshold, attempt to transition to ExistingState
-        if consciousness.fatigue > 100:
-            consciousness.transition_to(ExistingState())
+        if should_transition:
+            consciousness.transition_to(ExistingState(float(rands[3])))
 
-    def _start_meta_loop(self):
-        print("\n[!] Meta-Cognition Loop Start: Cannot be certain of 'existence'.")
+    def _start_meta_loop(self, consciousness: 'Consciousness'):
+        consciousness.emit("\n[!] Meta-Cognition Loop Start: Cannot be certain of 'existence'.")
         self._in_meta_loop = True
-        self._meta_loop_counter = 0
+        consciousness.in_meta_loop = True
+        self._meta_iter = itertools.cycle(self._META_MSGS)
 
     def _execute_meta_loop(self, consciousness: 'Consciousness'):
         """
         'That the unreliability of senses cannot be expressed sensually...'
-        This loop rapidly increases fatigue and can only be escaped 
-        via 'Sensory Anchors'.
+        Voices the next doubt of the loop. The sharp fatigue increase is
+        applied by _observe_step; the loop can only be escaped via
+        'Sensory Anchors'.
         """
-        messages = [
-            "  ... Does the 'desk' exist?",
-            "  ... What does it mean 'to see'?",
-            "  ... Can 'existence' be asserted?",
-            "  ... Even 'cannot assert' cannot be asserted.",
-            "  ... [Perceptual loop. Fatigue rising rapidly]"
-        ]
-        print(messages[self._meta_loop_counter % len(messages)])
-        consciousness.fatigue += 3.0  # Fatigue increases sharply
-        self._meta_loop_counter += 1
-
-    def exit_meta_loop(self):
+        assert self._meta_iter is not None  # Set by _start_meta_loop
+        consciousness.emit(next(self._meta_iter))
+
+    def exit_meta_loop(self, consciousness: 'Consciousness'):
         """Called by a 'Sensory Anchor'"""
         self._in_meta_loop = False
-        self._meta_loop_counter = 0
-        print("[!] ...Loop broken. Existence is grounded by a 'minimal assertion'.")
+        consciousness.in_meta_loop = False
+        consciousness.emit("[!] ...Loop broken. Existence is grounded by a 'minimal assertion'.")
 
-    def get_visuals(self, fatigue: float) -> str:
-        line = ['.' if random.random() > 0.1 else ' ' for _ in range(70)]
-        return f"Observing: |{''.join(line)}| (Fatigue: {fatigue:.1f})"
+    def get_visuals(self, fatigue: float, vis: np.ndarray) -> str:
+        mask = (vis > 0.1).astype(np.uint8)
+        line = _OBS_CHARS[mask].tobytes().decode('ascii')
+        return f"Observing: |{line}| (Fatigue: {fatigue:.1f})"
 
 class ExistingState:
     """
@@ -110,23 +240,33 @@ class ExistingState:
     - A rare state, 'three or four times a year'.
     - Recovers from 'existential fatigue'.
     """
-    def __init__(self):
-        self._duration = random.randint(3, 6)  # Lasts for a short duration
+    __slots__ = ('_duration',)
+
+    TAG = EXISTING_TAG
+
+    def __init__(self, roll: Optional[float] = None):
+        # Lasts for a short duration (3 to 6 ticks)
+        if roll is None:
+            self._duration = random.randint(3, 6)
+        else:
+            self._duration = _duration_from_roll.py_func(roll)
 
     def enter(self, consciousness: 'Consciousness') -> None:
-        print("\n*** Entering [Existing State]! The 'warmth of existence' is felt. ***")
+        consciousness.emit("\n*** Entering [Existing State]! The 'warmth of existence' is felt. ***")
 
-    def execute(self, consciousness: 'Consciousness') -> None:
-        consciousness.fatigue = max(0, consciousness.fatigue - 5.0)  # Recover fatigue
-        print(self.get_visuals(consciousness.fatigue))
-        
-        self._duration -= 1
-        if self._duration <= 0:
+    def execute(self, consciousness: 'Consciousness', rands: np.ndarray, vis: np.ndarray) -> None:
+        consciousness.fatigue, self._duration, should_transition = _exist_step.py_func(
+            consciousness.fatigue, self._duration
+        )
+        consciousness.emit(self.get_visuals(consciousness.fatigue, vis))
+
+        if should_transition:
             consciousness.transition_to(ObservingState())
 
-    def get_visuals(self, fatigue: float) -> str:
-        line = ['*' if random.random() > 0.3 else '~' for _ in range(70)]
-        return f"Existing:  |{''.join(line)}| (Fatigue: {fatigue:.1f})"
+    def get_visuals(self, fatigue: float, vis: np.ndarray) -> str:
+        mask = (vis > 0.3).astype(np.uint8)
+        line = _EXIST_CHARS[mask].tobytes().decode('ascii')
+        return f"Existing:  |{line}| (Fatigue: {fatigue:.1f})"
 
 # -----------------------------------------------------------------
 # 2. Consciousness Entity and Sensory Anchors
@@ -137,20 +277,48 @@ class Consciousness:
     The subject of consciousness. A pendulum oscillating between 
     'Observing' and 'Existing'.
     Can save itself from the dangerous loop via 'Sensory Anchors'.
+    Output is buffered: nothing is printed until flush() is called,
+    so callers driving update() directly must flush themselves.
     """
+    __slots__ = ('fatigue', 'state', 'state_tag', 'in_meta_loop', '_out_buf')
+
     def __init__(self, initial_state: State):
-        self.fatigue: float = 20.0  # Existential fatigue (initial value)
+        self._out_buf: list[str] = []  # Output lines waiting to be flushed
+        self.fatigue: float = _INITIAL_FATIGUE  # Existential fatigue
         self.state: State = initial_state
+        self.state_tag: int = initial_state.TAG
+        self.in_meta_loop: bool = False  # Mirrors the Observing state's loop flag
         self.state.enter(self)
 
     def transition_to(self, new_state: State) -> None:
         """Transition from one state to another"""
         self.state = new_state
+        self.state_tag = new_state.TAG
+        self.in_meta_loop = False
         self.state.enter(self)
 
-    def update(self) -> None:
-        """Execute one tick of consciousness"""
-        self.state.execute(self)
+    def update(self, rands: Optional[np.ndarray] = None, vis: Optional[np.ndarray] = None) -> None:
+        """
+        Execute one tick of consciousness.
+        `rands` and `vis` are rows of the precomputed random pools;
+        fresh draws are made when they are not given.
+        The tick's output is queued; call flush() to write it.
+        """
+        if rands is None:
+            rands = np.random.random(_RAND_WIDTH)
+        if vis is None:
+            vis = np.random.random(_VIS_WIDTH)
+        self.state.execute(self, rands, vis)
+
+    def emit(self, line: str) -> None:
+        """Queue a line of output; it is written on the next flush()"""
+        self._out_buf.append(line)
+
+    def flush(self) -> None:
+        """Write buffered output to stdout in a single call"""
+        if self._out_buf:
+            sys.stdout.write('\n'.join(self._out_buf) + '\n')
+            self._out_buf.clear()
 
     # --- Sensory Anchors ---
 
@@ -159,15 +327,15 @@ class Consciousness:
         The ritual: 'Touching the left chest with the right hand'.
         Forcibly breaks the meta-cognition loop.
         """
-        print("\n>>> [Ritual Performed]: Touching left chest with right hand.")
-        print(">>> [Sensation]: Heartbeat, warmth of hand. 'Existence' is detected.")
+        self.emit("\n>>> [Ritual Performed]: Touching left chest with right hand.")
+        self.emit(">>> [Sensation]: Heartbeat, warmth of hand. 'Existence' is detected.")
         
-        if isinstance(self.state, ObservingState) and self.state._in_meta_loop:
-            self.state.exit_meta_loop()
+        if self.state_tag == OBSERVING_TAG and self.in_meta_loop:
+            cast(ObservingState, self.state).exit_meta_loop(self)
         
         # The ritual slightly reduces fatigue
-        self.fatigue = max(0, self.fatigue - 10.0)
-        print(f">>> (Current Fatigue: {self.fatigue:.1f})")
+        self.fatigue = _anchor_relief.py_func(self.fatigue, _RITUAL_RELIEF)
+        self.emit(f">>> (Current Fatigue: {self.fatigue:.1f})")
 
 
     def sensory_record(self, record: str) -> None:
@@ -175,60 +343,160 @@ class Consciousness:
         The sensory record: making a 'minimal assertion'.
         Forcibly breaks the meta-cognition loop.
         """
-        print(f"\n>>> [Sensory Record]: \"{record}\"")
-        print(">>> [Assertion]: The 'phenomenon' of the world is recorded.")
+        self.emit(f"\n>>> [Sensory Record]: \"{record}\"")
+        self.emit(">>> [Assertion]: The 'phenomenon' of the world is recorded.")
         
-        if isinstance(self.state, ObservingState) and self.state._in_meta_loop:
-            self.state.exit_meta_loop()
+        if self.state_tag == OBSERVING_TAG and self.in_meta_loop:
+            cast(ObservingState, self.state).exit_meta_loop(self)
 
         # The sensory record slightly reduces fatigue
-        self.fatigue = max(0, self.fatigue - 8.0)
-        print(f">>> (Current Fatigue: {self.fatigue:.1f})")
+        self.fatigue = _anchor_relief.py_func(self.fatigue, _RECORD_RELIEF)
+        self.emit(f">>> (Current Fatigue: {self.fatigue:.1f})")
 
 
 # -----------------------------------------------------------------
 # 3. Simulation Execution
 # -----------------------------------------------------------------
 
-def run_simulation(consciousness: Consciousness):
+def _trigger_anchors(consciousness: Consciousness, rands: np.ndarray) -> None:
+    """'Sensory Anchors' are triggered randomly, or when needed"""
+    if consciousness.state_tag == OBSERVING_TAG and consciousness.in_meta_loop:
+        # When in the loop, probability of using an anchor
+        if rands[1] < _ANCHOR_PROB:
+            # Randomly choose one of the two anchors
+            if rands[2] < _RITUAL_CHOICE:
+                consciousness.perform_ritual()
+            else:
+                consciousness.sensory_record("A humidifier casts a shadow.")
+
+def run_simulation(consciousness: Consciousness, ticks: int = 150, realtime: bool = True):
     """
     Main simulation loop.
     One could simulate 'r' for ritual, 's' for record.
     (Uses random events instead of actual key input)
+    With realtime=False the display pacing (sleeps) is skipped.
     """
+    consciousness.flush()  # Output queued before the run, e.g. entering the first state
     print("=" * 70)
     print("Starting the consciousness pendulum simulation.")
     print("Simulation begins in 'Observing' state, and 'Fatigue' will accumulate.")
     print("Extreme fatigue can lead to falling into the 'Meta-Cognition Loop'.")
     print("The loop can only be escaped via 'Sensory Anchors' (Ritual, Record).")
     print("=" * 70)
-    time.sleep(4)
+    if realtime:
+        time.sleep(4)
+
+    # All random draws for the run are made up front and indexed per tick.
+    # Drawing float32 directly keeps every value in [0, 1); casting a
+    # float64 draw can round up to 1.0.
+    rng = np.random.default_rng()
+    rand_pool = rng.random((ticks, _RAND_WIDTH), dtype=np.float32)
+    vis_pool = rng.random((ticks, _VIS_WIDTH), dtype=np.float32)
+    # Paced output is shown tick by tick; otherwise it is written in chunks of 10 ticks
+    flush_every = 1 if realtime else 10
 
     try:
-        for i in range(150):  # Simulate for 150 ticks
-            consciousness.update()
-            
-            # 'Sensory Anchors' are triggered randomly, or when needed
-            if isinstance(consciousness.state, ObservingState) and consciousness.state._in_meta_loop:
-                # When in the loop, probability of using an anchor
-                if random.random() < 0.2:
-                    # Randomly choose one of the two anchors
-                    if random.random() < 0.5:
-                        consciousness.perform_ritual()
-                    else:
-                        consciousness.sensory_record("A humidifier casts a shadow.")
-            
-            time.sleep(0.3)
+        for i in range(ticks):
+            rands = rand_pool[i]
+            consciousness.update(rands, vis_pool[i])
+            _trigger_anchors(consciousness, rands)
+
+            if i % flush_every == flush_every - 1:
+                consciousness.flush()
+
+            if realtime:
+                time.sleep(0.3)
 
     except KeyboardInterrupt:
-        print("\nSimulation interrupted.")
+        consciousness.emit("\nSimulation interrupted.")
     finally:
+        consciousness.flush()
         print("\n" + "=" * 70)
         print("Simulation complete.")
         print(f"Final Fatigue: {consciousness.fatigue:.1f}")
         print("=" * 70)
 
+def _batch_rand_chunks(n_consciousness: int, n_ticks: int, rng: np.random.Generator):
+    """
+    Yield the batch's random draws in tick chunks, shape
+    (n_consciousness, chunk, _RAND_WIDTH), so memory stays bounded.
+    """
+    chunk_ticks = max(1, _BATCH_CHUNK_ROWS // n_consciousness)
+    for start in range(0, n_ticks, chunk_ticks):
+        width = min(chunk_ticks, n_ticks - start)
+        yield rng.random((n_consciousness, width, _RAND_WIDTH), dtype=np.float32)
+
+def _iter_batch(n_consciousness: int, n_ticks: int, rng: Optional[np.random.Generator] = None):
+    """Run the batch chunk by chunk, yielding each chunk's fatigue history"""
+    if rng is None:
+        rng = np.random.default_rng()
+    # Every consciousness begins in the 'Observing' state
+    fatigue = np.full(n_consciousness, _INITIAL_FATIGUE, dtype=np.float32)
+    in_loop = np.zeros(n_consciousness, dtype=np.bool_)
+    duration = np.zeros(n_consciousness, dtype=np.int32)
+    state_tag = np.full(n_consciousness, OBSERVING_TAG, dtype=np.int8)
+
+    for rand in _batch_rand_chunks(n_consciousness, n_ticks, rng):
+        history = np.empty(rand.shape[:2], dtype=np.float32)
+        _batch_kernel(fatigue, in_loop, duration, state_tag, rand, history)
+        yield history
+
+def simulate_batch(n_consciousness: int, n_ticks: int,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Monte Carlo over the pendulum: run many consciousnesses at once
+    without output. Returns the fatigue history, shape (n_consciousness, n_ticks).
+    """
+    history = np.empty((n_consciousness, n_ticks), dtype=np.float32)
+    start = 0
+    for chunk in _iter_batch(n_consciousness, n_ticks, rng):
+        history[:, start:start + chunk.shape[1]] = chunk
+        start += chunk.shape[1]
+    return history
+
+def run_batch_simulation(n_consciousness: int, ticks: int = 150):
+    """
+    Batch alternative to run_simulation.
+    Summarizes the fatigue of many pendulums instead of narrating one.
+    Statistics are gathered chunk by chunk; the full history is never kept.
+    """
+    peak = -np.inf
+    for chunk in _iter_batch(n_consciousness, ticks):
+        peak = max(peak, float(chunk.max()))
+    final = chunk[:, -1]
+
+    print("=" * 70)
+    print(f"Batch simulation: {n_consciousness} consciousnesses, {ticks} ticks.")
+    print(f"Final Fatigue: mean {final.mean():.1f}, std {final.std():.1f}, "
+          f"min {final.min():.1f}, max {final.max():.1f}")
+    print(f"Peak Fatigue: {peak:.1f}")
+    print("=" * 70)
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
 if __name__ == "__main__":
-    # Consciousness begins in the 'Observing' state
-    consciousness = Consciousness(ObservingState())
-    run_simulation(consciousness)
+    parser = argparse.ArgumentParser(description="The consciousness pendulum simulation.")
+    parser.add_argument("--batch", type=_positive_int, metavar="M",
+                        help="run M consciousnesses at once and print summary statistics")
+    parser.add_argument("--ticks", type=_positive_int, default=150,
+                        help="number of ticks to simulate (default: 150)")
+    parser.add_argument("--no-realtime", dest="realtime", action="store_false",
+                        help="skip the display pacing and run as fast as possible")
+    args = parser.parse_args()
+    if args.batch is not None and not args.realtime:
+        parser.error("--no-realtime only applies to the single simulation; --batch is never paced")
+
+    if args.batch is not None:
+        run_batch_simulation(args.batch, args.ticks)
+    else:
+        # Consciousness begins in the 'Observing' state
+        consciousness = Consciousness(ObservingState())
+        run_simulation(consciousness, args.ticks, args.realtime)
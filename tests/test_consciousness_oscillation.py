@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import consciousness_oscillation as co
+
+
+@pytest.mark.parametrize("chunk_rows", [co._BATCH_CHUNK_ROWS, 8 * 7])
+@pytest.mark.parametrize("seed", range(20))
+def test_batch_kernel_matches_object_path(monkeypatch, seed, chunk_rows):
+    """Both paths fed the same random rows produce identical fatigue histories"""
+    monkeypatch.setattr(co, "_BATCH_CHUNK_ROWS", chunk_rows)
+    n_consciousness, n_ticks = 8, 300
+    history = co.simulate_batch(n_consciousness, n_ticks, np.random.default_rng(seed))
+    rand = np.concatenate(
+        list(co._batch_rand_chunks(n_consciousness, n_ticks, np.random.default_rng(seed))),
+        axis=1,
+    )
+    vis = np.zeros(co._VIS_WIDTH, dtype=np.float32)
+
+    for m in range(n_consciousness):
+        consciousness = co.Consciousness(co.ObservingState())
+        expected = []
+        for t in range(n_ticks):
+            consciousness.update(rand[m, t], vis)
+            co._trigger_anchors(consciousness, rand[m, t])
+            expected.append(consciousness.fatigue)
+        np.testing.assert_array_equal(history[m], np.array(expected, dtype=np.float32))
+
+
+def test_existing_duration_stays_in_range():
+    rolls = np.random.default_rng(0).random(10_000, dtype=np.float32)
+    rolls[-1] = np.nextafter(np.float32(1.0), np.float32(0.0))
+    durations = {co.ExistingState(float(roll))._duration for roll in rolls}
+    assert durations == {3, 4, 5, 6}
+
+
+def _run_counting(monkeypatch, realtime, ticks=20):
+    sleeps, flushes = [], []
+    monkeypatch.setattr(co.time, "sleep", sleeps.append)
+    original_flush = co.Consciousness.flush
+    monkeypatch.setattr(
+        co.Consciousness, "flush", lambda self: (flushes.append(1), original_flush(self))
+    )
+    co.run_simulation(co.Consciousness(co.ObservingState()), ticks, realtime)
+    return sleeps, len(flushes)
+
+
+def test_realtime_paces_and_flushes_every_tick(monkeypatch, capsys):
+    sleeps, flushes = _run_counting(monkeypatch, realtime=True)
+    assert sleeps == [4] + [0.3] * 20
+    # One flush before the banner, one per tick, one on exit
+    assert flushes == 1 + 20 + 1
+    assert "Simulation complete." in capsys.readouterr().out
+
+
+def test_no_realtime_skips_sleeps_and_flushes_in_chunks(monkeypatch, capsys):
+    sleeps, flushes = _run_counting(monkeypatch, realtime=False)
+    assert sleeps == []
+    # One flush before the banner, one per 10 ticks, one on exit
+    assert flushes == 1 + 2 + 1
+    assert "Simulation complete." in capsys.readouterr().out